@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import argparse
 import csv
 import sys
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 
 from .pdf_processing import extract_text_from_txt, extract_text_per_page
 from .tokenizer import tokenize_and_deduplicate
 
+_CSV_BUFFER_SIZE = 1 << 20
+
 
 def _prompt(message: str, validator: Callable[[str], bool]) -> str:
     while True:
@@ -30,8 +33,36 @@ def _ensure_csv_suffix(filename: str) -> str:
     return filename
 
 
-def main() -> None:
+def _load_tokenizer(backend: str) -> Callable[[Iterable[str]], List[Tuple[str, str]]]:
+    if backend == "fugashi":
+        from .tokenizer_fugashi import tokenize_and_deduplicate as tokenize
+
+        return tokenize
+    return tokenize_and_deduplicate
+
+
+def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="jptext-extract",
+        description="Extract a deduplicated Japanese vocabulary list from PDF or TXT files.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=("sudachi", "fugashi"),
+        default="sudachi",
+        help="morphological analyzer to use (fugashi requires the 'fugashi' extra)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(backend: str = "sudachi") -> None:
     """Run the interactive extraction workflow."""
+    try:
+        tokenize = _load_tokenizer(backend)
+    except ImportError as exc:
+        print(f"Tokenizer backend '{backend}' is unavailable: {exc}")
+        return
+
     print("JPText Extract — Japanese vocabulary extractor")
     print("Ctrl+C or type 'q' at the file prompt to exit.\n")
 
@@ -74,18 +105,19 @@ def main() -> None:
                 )
             else:
                 pages = extract_text_from_txt(source_path)
+            # Pages are extracted lazily while they are tokenized.
+            tokens = tokenize(pages)
         except Exception as exc:  # pragma: no cover - CLI feedback
             print(f"処理に失敗しました: {exc}")
             continue
 
-        tokens = tokenize_and_deduplicate(pages)
         surfaces = [surface for _reading, surface in tokens if surface]
 
         try:
-            with csv_path.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.writer(handle)
-                for surface in surfaces:
-                    writer.writerow([surface])
+            with csv_path.open(
+                "w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE
+            ) as handle:
+                csv.writer(handle).writerows([surface] for surface in surfaces)
         except OSError as exc:  # pragma: no cover - IO errors
             print(f"Failed to write CSV: {exc}")
             continue
@@ -96,8 +128,9 @@ def main() -> None:
 
 def entry_point() -> None:
     """Console script entry point."""
+    args = _parse_args()
     try:
-        main()
+        main(backend=args.backend)
     except KeyboardInterrupt:  # pragma: no cover - user interruption
         print("\n終了します。")
 
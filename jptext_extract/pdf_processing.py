@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Iterator, List, Optional, Tuple
 import unicodedata
 
 from pdfminer.high_level import extract_pages
 from pdfminer.layout import LTTextContainer
+from pdfminer.pdfdocument import PDFDocument
 from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
+
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - optional dependency at runtime
+    pymupdf = None  # type: ignore
 
 try:
     from pdf2image import convert_from_path
@@ -25,6 +36,10 @@ except ImportError:  # pragma: no cover - optional dependency at runtime
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of consecutive pages rasterized by a single Poppler call.
+_OCR_BATCH_PAGES = 16
+# Approximate number of bytes of a text file decoded and normalized at once.
+_TXT_CHUNK_BYTES = 1 << 20
 
 _JAPANESE_RANGES = [
     ("\u3000", "\u303F"),  # punctuation
@@ -37,50 +52,83 @@ _JAPANESE_RANGES = [
     ("\uFF66", "\uFF9F"),  # half-width katakana
 ]
 
+# Runs of characters outside the Japanese ranges (whitespace is kept so it can
+# be collapsed afterwards). ``re`` compiles the class into a code-point bitmap,
+# so the whole scan is a table lookup per character in C.
+_NON_JAPANESE_RE = re.compile(
+    "[^\\s" + "".join(f"{start}-{end}" for start, end in _JAPANESE_RANGES) + "]+"
+)
+
+
+def _normalize_nfkc(text: str) -> str:
+    """Apply NFKC normalization one line at a time.
+
+    ``unicodedata.normalize`` hands back text that is already normalized after
+    a quick check, but a single character that needs work sends the whole
+    string through the slow decompose/recompose path. Normalizing line by line
+    limits that cost to the lines that need it; nothing composes across a
+    newline, so the result is unchanged.
+
+    Text that is already NFKC as a whole is returned as-is, without splitting
+    and re-joining it.
+    """
+    if unicodedata.is_normalized("NFKC", text):
+        return text
+    return "\n".join([unicodedata.normalize("NFKC", line) for line in text.split("\n")])
+
 
 def filter_non_japanese(text: str) -> str:
     """Normalize text to NFKC and keep only Japanese-relevant characters."""
     if not text:
         return ""
 
-    normalized = unicodedata.normalize("NFKC", text)
-    normalized = normalized.replace("\u3000", " ")
-    filtered_chars = []
-    for char in normalized:
-        if char.isspace():
-            filtered_chars.append(" ")
-            continue
-        code_point = ord(char)
-        for start, end in _JAPANESE_RANGES:
-            if ord(start) <= code_point <= ord(end):
-                filtered_chars.append(char)
-                break
-    filtered_text = "".join(filtered_chars)
-    filtered_text = re.sub(r"\s+", " ", filtered_text)
-    return filtered_text.strip()
+    # NFKC already folds the ideographic space (U+3000) into an ASCII space.
+    normalized = _normalize_nfkc(text)
+    filtered_text = _NON_JAPANESE_RE.sub("", normalized)
+    return " ".join(filtered_text.split())
 
 
 def _count_pages(pdf_path: Path) -> int:
+    """Read the page count from the PDF catalog, scanning the page tree only as a fallback."""
     with pdf_path.open("rb") as stream:
-        return sum(1 for _ in PDFPage.get_pages(stream))
+        document = PDFDocument(PDFParser(stream))
+        try:
+            pages = resolve1(document.catalog["Pages"])
+            return int(resolve1(pages["Count"]))
+        except (KeyError, TypeError, ValueError):
+            LOGGER.debug("PDF catalog has no usable page count; counting pages")
+            return sum(1 for _ in PDFPage.create_pages(document))
 
 
-def _ocr_page(pdf_path: Path, page_number: int) -> str:
-    """Perform OCR on the given page using pytesseract configured for Japanese."""
-    if convert_from_path is None or pytesseract is None:
-        LOGGER.debug("OCR dependencies missing; skipping OCR for page %s", page_number)
-        return ""
+def _pymupdf_pages(pdf_path: Path) -> Tuple[int, Iterator[str]]:
+    """Return the page count and raw page texts extracted by MuPDF."""
+    document = pymupdf.open(str(pdf_path))
 
-    try:
-        images = convert_from_path(str(pdf_path), first_page=page_number, last_page=page_number)
-    except Exception as exc:  # pragma: no cover - dependent on external binaries
-        LOGGER.warning("Failed to rasterize page %s for OCR: %s", page_number, exc)
-        return ""
+    def _pages() -> Iterator[str]:
+        with document:
+            for page in document:
+                yield page.get_text("text")
+
+    return document.page_count, _pages()
+
+
+def _pdfminer_pages(pdf_path: Path) -> Tuple[int, Iterator[str]]:
+    """Return the page count and raw page texts extracted by pdfminer."""
+    total_pages = _count_pages(pdf_path)
+
+    def _pages() -> Iterator[str]:
+        for page_layout in extract_pages(str(pdf_path)):
+            yield "".join(
+                element.get_text()
+                for element in page_layout
+                if isinstance(element, LTTextContainer)
+            )
+
+    return total_pages, _pages()
 
-    if not images:
-        return ""
 
-    image = images[0]
+def _ocr_image(image: object, page_number: int) -> str:
+    """Run Japanese OCR on a rendered page image."""
     try:
         text = pytesseract.image_to_string(image, lang="jpn")
     except Exception as exc:  # pragma: no cover - runtime issue
@@ -90,57 +138,153 @@ def _ocr_page(pdf_path: Path, page_number: int) -> str:
     return filter_non_japanese(text)
 
 
+def _ocr_workers() -> int:
+    """Return how many tesseract processes to run at once.
+
+    Every tesseract process starts its own OpenMP thread pool, so one process
+    per core would run about cores² threads. As tesseract's documentation
+    recommends for parallel use, ``OMP_THREAD_LIMIT`` defaults to 1 for the
+    child processes. An explicit user setting is kept and shrinks the number
+    of concurrent processes instead.
+    """
+    thread_limit = os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    try:
+        threads_per_process = max(1, int(thread_limit))
+    except ValueError:
+        threads_per_process = 1
+    return max(1, (os.cpu_count() or 1) // threads_per_process)
+
+
+def _ocr_pages(pdf_path: Path, first_page: int, last_page: int) -> List[str]:
+    """Perform OCR on a contiguous page range using pytesseract configured for Japanese.
+
+    The range is rasterized with a single Poppler call and the pages are
+    recognized concurrently. ``first_page`` and ``last_page`` are 1-indexed and
+    inclusive; one string is returned per page in the range.
+    """
+    page_count = last_page - first_page + 1
+    if convert_from_path is None or pytesseract is None:
+        LOGGER.debug(
+            "OCR dependencies missing; skipping OCR for pages %s-%s", first_page, last_page
+        )
+        return [""] * page_count
+
+    try:
+        images = convert_from_path(str(pdf_path), first_page=first_page, last_page=last_page)
+    except Exception as exc:  # pragma: no cover - dependent on external binaries
+        LOGGER.warning(
+            "Failed to rasterize pages %s-%s for OCR: %s", first_page, last_page, exc
+        )
+        return [""] * page_count
+
+    # pytesseract runs the tesseract binary in a subprocess, so threads are
+    # enough to keep every core busy without pickling the images.
+    page_numbers = range(first_page, first_page + len(images))
+    with ThreadPoolExecutor(max_workers=_ocr_workers()) as executor:
+        texts = list(executor.map(_ocr_image, images, page_numbers))
+
+    return texts + [""] * (page_count - len(texts))
+
+
+def _iter_page_texts(
+    pdf_path: Path,
+    total_pages: int,
+    raw_pages: Iterator[str],
+    progress_callback: Optional[Callable[[int, int], None]],
+) -> Iterator[str]:
+    """Yield normalized page texts in order, OCR-ing runs of pages without text."""
+    ocr_first: Optional[int] = None
+    ocr_last = 0
+
+    for index, raw_text in enumerate(raw_pages, start=1):
+        if progress_callback:
+            progress_callback(index, total_pages)
+
+        normalized = filter_non_japanese(raw_text)
+
+        if not normalized:
+            if ocr_first is not None and ocr_last - ocr_first + 1 == _OCR_BATCH_PAGES:
+                yield from _ocr_pages(pdf_path, ocr_first, ocr_last)
+                ocr_first = None
+            if ocr_first is None:
+                ocr_first = index
+            ocr_last = index
+            continue
+
+        if ocr_first is not None:
+            yield from _ocr_pages(pdf_path, ocr_first, ocr_last)
+            ocr_first = None
+
+        yield normalized
+
+    if ocr_first is not None:
+        yield from _ocr_pages(pdf_path, ocr_first, ocr_last)
+
+
 def extract_text_per_page(
     pdf_path: Path,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-) -> List[str]:
+) -> Iterator[str]:
     """Extract normalized Japanese text from each page of the PDF.
 
+    Text is extracted with PyMuPDF when it is installed and with pdfminer.six
+    otherwise. Pages are produced lazily so callers can process them as they
+    are extracted; consecutive pages without embedded text are rasterized and
+    OCR'd together before being yielded in order.
+
     Args:
         pdf_path: Path to the PDF document.
         progress_callback: Optional callable receiving the current page index
             (1-indexed) and total page count.
 
     Returns:
-        A list of normalized Japanese strings, one for each page.
+        An iterator of normalized Japanese strings, one for each page.
     """
 
     pdf_path = pdf_path.expanduser().resolve()
     if not pdf_path.exists():
         raise FileNotFoundError(f"PDF not found: {pdf_path}")
 
-    total_pages = _count_pages(pdf_path)
-    texts: List[str] = []
+    if pymupdf is not None:
+        total_pages, raw_pages = _pymupdf_pages(pdf_path)
+    else:
+        total_pages, raw_pages = _pdfminer_pages(pdf_path)
 
-    for index, page_layout in enumerate(extract_pages(str(pdf_path)), start=1):
-        if progress_callback:
-            progress_callback(index, total_pages)
+    return _iter_page_texts(pdf_path, total_pages, raw_pages, progress_callback)
 
-        fragments = [
-            element.get_text()
-            for element in page_layout
-            if isinstance(element, LTTextContainer)
-        ]
-        raw_text = "".join(fragments)
-        normalized = filter_non_japanese(raw_text)
 
-        if not normalized:
-            normalized = _ocr_page(pdf_path, index)
+def _iter_txt_chunks(txt_path: Path) -> Iterator[str]:
+    """Yield normalized text from a memory-mapped file, roughly a chunk at a time."""
+    with txt_path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return
 
-        texts.append(normalized)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            start = 0
+            while start < size:
+                # Cut on a newline so no UTF-8 sequence is split between chunks.
+                newline = mapped.find(b"\n", start + _TXT_CHUNK_BYTES)
+                end = size if newline == -1 else newline + 1
+                normalized = filter_non_japanese(mapped[start:end].decode("utf-8"))
+                if normalized:
+                    yield normalized
+                start = end
 
-    return texts
 
+def extract_text_from_txt(txt_path: Path) -> Iterator[str]:
+    """Read and normalize Japanese text from a UTF-8 encoded plain text file.
 
-def extract_text_from_txt(txt_path: Path) -> List[str]:
-    """Read and normalize Japanese text from a UTF-8 encoded plain text file."""
+    The file is memory-mapped and decoded in chunks of about
+    ``_TXT_CHUNK_BYTES`` ending on line boundaries, so only one chunk is held
+    as text at a time. Chunks are produced lazily.
+    """
 
     txt_path = txt_path.expanduser().resolve()
-    with txt_path.open("r", encoding="utf-8") as handle:
-        raw_text = handle.read()
+    if not txt_path.exists():
+        raise FileNotFoundError(f"Text file not found: {txt_path}")
 
-    normalized = filter_non_japanese(raw_text)
-    return [normalized]
+    return _iter_txt_chunks(txt_path)
 
 
 __all__ = ["extract_text_per_page", "extract_text_from_txt", "filter_non_japanese"]
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import logging
-from collections import OrderedDict
+import os
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import lru_cache
-from typing import Dict, Iterable, List, Tuple
+from typing import Callable, Deque, Dict, Iterable, List, Set, Tuple
 
 from sudachipy import dictionary, tokenizer as sudachi_tokenizer
 
@@ -14,119 +19,240 @@ LOGGER = logging.getLogger(__name__)
 Tokenizer = sudachi_tokenizer.Tokenizer
 SplitMode = sudachi_tokenizer.Tokenizer.SplitMode
 
+# Maps katakana ァ (U+30A1) through ヶ (U+30F6) onto their hiragana counterparts.
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+_KANJI_RE = re.compile("[\u4E00-\u9FFF]")
+# Text reaching the tokenizer has been through filter_non_japanese: NFKC turns
+# "！"/"？" into ASCII (which the filter drops) and whitespace is collapsed to
+# single spaces, so "。" is the only sentence terminator left.
+_SENTENCE_RE = re.compile("[^。]+。?")
+# Longest piece fed to the analyzer at once. This keeps the lattice small, and
+# Sudachi rejects inputs over ~48KB outright.
+_MAX_SENTENCE_CHARS = 1024
+
+# Readings and surfaces repeat heavily within a document, so the string helpers
+# are memoized; the bound keeps long multi-file sessions from growing forever.
+_HELPER_CACHE_SIZE = 100_000
+
+# Major part-of-speech tag of punctuation such as "。" and "、" (Sudachi and UniDic).
+_PUNCTUATION_POS = "補助記号"
+
+_THREAD_STATE = threading.local()
+
 
 @lru_cache(maxsize=1)
+def _get_dictionary() -> dictionary.Dictionary:
+    """Load and cache the SudachiPy dictionary shared by every thread."""
+    return dictionary.Dictionary()
+
+
 def _get_tokenizer() -> Tokenizer:
-    """Create and cache a SudachiPy tokenizer instance."""
-    return dictionary.Dictionary().create()
+    """Return the SudachiPy tokenizer owned by the calling thread.
+
+    A tokenizer must not be shared between threads, so each worker creates its
+    own from the shared dictionary on first use.
+    """
+    tokenizer = getattr(_THREAD_STATE, "tokenizer", None)
+    if tokenizer is None:
+        tokenizer = _THREAD_STATE.tokenizer = _get_dictionary().create()
+    return tokenizer
 
 
-def _katakana_to_hiragana(text: str) -> str:
-    result = []
-    for char in text:
-        code = ord(char)
-        if 0x30A1 <= code <= 0x30F6:
-            result.append(chr(code - 0x60))
-        else:
-            result.append(char)
-    return "".join(result)
+@lru_cache(maxsize=_HELPER_CACHE_SIZE)
+def _hiragana_reading(reading: str) -> str:
+    """Fold a katakana reading to hiragana and trim it in a single cached step."""
+    return reading.translate(_KATAKANA_TO_HIRAGANA).strip()
 
 
+@lru_cache(maxsize=_HELPER_CACHE_SIZE)
 def _contains_kanji(text: str) -> bool:
-    return any(0x4E00 <= ord(ch) <= 0x9FFF for ch in text)
+    return _KANJI_RE.search(text) is not None
+
 
+def _register_surface(
+    by_reading: Dict[str, Dict[str, None]],
+    kanji_readings: Set[str],
+    reading: str,
+    surface: str,
+) -> None:
+    """Register a surface form for a reading, preferring kanji variants.
 
-def _register_surface(by_reading: Dict[str, Dict[str, object]], reading: str, surface: str) -> None:
-    """Register a surface form for a reading, preferring kanji variants."""
+    ``by_reading`` maps each reading to its surfaces in first-seen order (a dict
+    used as an ordered set); ``kanji_readings`` holds the readings that already
+    have a kanji surface, whose kana-only surfaces are discarded.
+    """
 
     if not reading or not surface:
         return
 
-    entry = by_reading.setdefault(
-        reading,
-        {"order": OrderedDict(), "has_kanji": False},
-    )
-    order: OrderedDict[str, int] = entry["order"]  # type: ignore[assignment]
-
-    if surface in order:
+    # get() rather than setdefault(): the common "reading already seen" path
+    # should not allocate a throwaway default dict.
+    surfaces = by_reading.get(reading)
+    if surfaces is None:
+        surfaces = by_reading[sys.intern(reading)] = {}
+    elif surface in surfaces:
         return
 
-    contains_kanji = _contains_kanji(surface)
-
-    if contains_kanji:
-        if not entry["has_kanji"]:
-            order.clear()
-        entry["has_kanji"] = True
-        order[surface] = len(order)
+    # Only strings that end up stored are interned, so repeats across pages and
+    # phrases share one object without taxing the lookup-only path.
+    if _contains_kanji(surface):
+        if reading not in kanji_readings:
+            surfaces.clear()
+            kanji_readings.add(sys.intern(reading))
+        surfaces[sys.intern(surface)] = None
         return
 
-    if entry["has_kanji"]:
+    if reading in kanji_readings:
         return
 
-    order[surface] = len(order)
+    surfaces[sys.intern(surface)] = None
 
 
-def tokenize_and_deduplicate(texts: Iterable[str]) -> List[Tuple[str, str]]:
-    """Tokenize text, deduplicate by reading, and keep canonical forms.
+def _split_sentences(text: str) -> List[str]:
+    """Split normalized text into sentences of at most ``_MAX_SENTENCE_CHARS``.
 
-    Args:
-        texts: Iterable of normalized Japanese text strings.
-
-    Returns:
-        A list of tuples ``(hiragana_reading, canonical_surface)`` sorted by
-        the reading. Kanji surfaces are preferred over kana duplicates while
-        multi-word phrases are also emitted.
+    Overlong sentences (lists and vocabulary tables often have no "。") are cut
+    at the last space before the limit, and mid-run only when there is none.
+    """
+    sentences: List[str] = []
+    for sentence in _SENTENCE_RE.findall(text):
+        while len(sentence) > _MAX_SENTENCE_CHARS:
+            cut = sentence.rfind(" ", 1, _MAX_SENTENCE_CHARS + 1)
+            if cut == -1:
+                cut = _MAX_SENTENCE_CHARS
+            sentences.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip(" ")
+        if sentence:
+            sentences.append(sentence)
+    return sentences
+
+
+def _register_phrase(
+    by_reading: Dict[str, Dict[str, None]],
+    kanji_readings: Set[str],
+    readings: List[str],
+    original_surfaces: List[str],
+    pos_majors: List[str],
+) -> None:
+    """Register a sentence as a phrase unless it is a single word or all nouns.
+
+    ``readings`` and ``original_surfaces`` hold every morpheme of the sentence,
+    punctuation included, so the phrase matches the text; ``pos_majors`` holds
+    the words only, so punctuation never counts as one. The sentence's closing
+    "。" is left out of the phrase.
     """
 
+    if len(pos_majors) >= 2 and pos_majors.count("名詞") != len(pos_majors):
+        phrase_reading = "".join(readings).strip().rstrip("。")
+        phrase_surface = "".join(original_surfaces).strip().rstrip("。")
+        _register_surface(by_reading, kanji_readings, phrase_reading, phrase_surface)
+
+
+def _tokenize_page(text: str) -> Dict[str, Dict[str, None]]:
+    """Tokenize a single page and deduplicate its morphemes by reading."""
     tokenizer = _get_tokenizer()
     mode = SplitMode.C
 
-    by_reading: Dict[str, Dict[str, object]] = {}
-
-    for text in texts:
-        if not text:
-            continue
+    by_reading: Dict[str, Dict[str, None]] = {}
+    kanji_readings: Set[str] = set()
 
-        token_infos = []
+    for sentence in _split_sentences(text):
+        readings: List[str] = []
+        original_surfaces: List[str] = []
+        pos_majors: List[str] = []
 
-        for morpheme in tokenizer.tokenize(text, mode):
+        for morpheme in tokenizer.tokenize(sentence, mode):
             pos = morpheme.part_of_speech()
             if pos[0] == "記号":
                 continue
 
-            reading = _katakana_to_hiragana(morpheme.reading_form() or "")
-            reading = reading.strip()
+            reading = _hiragana_reading(morpheme.reading_form() or "")
             if not reading:
                 continue
 
-            canonical = morpheme.dictionary_form() or morpheme.surface()
+            original_surface = morpheme.surface()
+            canonical = morpheme.dictionary_form() or original_surface
             if _contains_kanji(canonical):
                 surface = canonical
             else:
-                surface = morpheme.surface()
-
-            _register_surface(by_reading, reading, surface)
-
-            token_infos.append(
-                {
-                    "reading": reading,
-                    "surface": surface,
-                    "original_surface": morpheme.surface(),
-                    "pos_major": pos[0],
-                }
-            )
-
-        if len(token_infos) >= 2 and any(info["pos_major"] != "名詞" for info in token_infos):
-            phrase_reading = "".join(info["reading"] for info in token_infos).strip()
-            phrase_surface = "".join(info["original_surface"] for info in token_infos).strip()
-            _register_surface(by_reading, phrase_reading, phrase_surface)
-
-    results: List[Tuple[str, str]] = []
-    for reading in sorted(by_reading.keys()):
-        order: OrderedDict[str, int] = by_reading[reading]["order"]  # type: ignore[assignment]
-        results.extend((reading, surface) for surface in order.keys())
-
-    return results
+                surface = original_surface
+
+            _register_surface(by_reading, kanji_readings, reading, surface)
+
+            original_surfaces.append(original_surface)
+            if pos[0] == _PUNCTUATION_POS:
+                # Brackets read as "キゴウ"; the symbol itself reads better.
+                readings.append(original_surface)
+                continue
+            readings.append(reading)
+            pos_majors.append(pos[0])
+
+        _register_phrase(by_reading, kanji_readings, readings, original_surfaces, pos_majors)
+
+    return by_reading
+
+
+def _merge_page(
+    by_reading: Dict[str, Dict[str, None]],
+    kanji_readings: Set[str],
+    page_by_reading: Dict[str, Dict[str, None]],
+) -> None:
+    """Fold a page's deduplicated table into the document-wide table."""
+
+    for reading, surfaces in page_by_reading.items():
+        for surface in surfaces:
+            _register_surface(by_reading, kanji_readings, reading, surface)
+
+
+def _deduplicate_pages(
+    tokenize_page: Callable[[str], Dict[str, Dict[str, None]]],
+    texts: Iterable[str],
+) -> List[Tuple[str, str]]:
+    """Run ``tokenize_page`` over every page and merge the per-page tables."""
+
+    by_reading: Dict[str, Dict[str, None]] = {}
+    kanji_readings: Set[str] = set()
+
+    # Pages are tokenized concurrently, one tokenizer per worker thread. Merging
+    # the per-page tables in page order keeps the result identical to a serial
+    # run. Only a few pages are in flight at once so lazily produced pages are
+    # never all held in memory.
+    max_workers = os.cpu_count() or 1
+    pending: Deque[Future[Dict[str, Dict[str, None]]]] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for text in texts:
+            if not text:
+                continue
+            pending.append(executor.submit(tokenize_page, text))
+            if len(pending) > 2 * max_workers:
+                _merge_page(by_reading, kanji_readings, pending.popleft().result())
+
+        while pending:
+            _merge_page(by_reading, kanji_readings, pending.popleft().result())
+
+    # One C-level sort of the merged table; readings are unique keys, so the
+    # tuple comparison never reaches the surface dicts.
+    return [
+        (reading, surface)
+        for reading, surfaces in sorted(by_reading.items())
+        for surface in surfaces
+    ]
+
+
+def tokenize_and_deduplicate(texts: Iterable[str]) -> List[Tuple[str, str]]:
+    """Tokenize text, deduplicate by reading, and keep canonical forms.
+
+    Args:
+        texts: Iterable of normalized Japanese text strings.
+
+    Returns:
+        A list of tuples ``(hiragana_reading, canonical_surface)`` sorted by
+        the reading. Kanji surfaces are preferred over kana duplicates while
+        multi-word phrases are also emitted, one per sentence.
+    """
+
+    return _deduplicate_pages(_tokenize_page, texts)
 
 
 __all__ = ["tokenize_and_deduplicate"]
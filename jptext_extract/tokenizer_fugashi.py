@@ -0,0 +1,90 @@
+"""Tokenization and deduplication helpers built around fugashi (MeCab + UniDic).
+
+This backend trades Sudachi's segmentation for MeCab's faster C core. It needs
+the optional ``fugashi`` extra (``pip install "jptext-extract[fugashi]"``).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, List, Set, Tuple
+
+import fugashi
+
+from .tokenizer import (
+    _PUNCTUATION_POS,
+    _contains_kanji,
+    _deduplicate_pages,
+    _hiragana_reading,
+    _register_phrase,
+    _register_surface,
+    _split_sentences,
+)
+
+_THREAD_STATE = threading.local()
+
+
+def _get_tagger() -> fugashi.Tagger:
+    """Return the fugashi tagger owned by the calling thread."""
+    tagger = getattr(_THREAD_STATE, "tagger", None)
+    if tagger is None:
+        tagger = _THREAD_STATE.tagger = fugashi.Tagger()
+    return tagger
+
+
+def _tokenize_page(text: str) -> Dict[str, Dict[str, None]]:
+    """Tokenize a single page and deduplicate its morphemes by reading."""
+    tagger = _get_tagger()
+
+    by_reading: Dict[str, Dict[str, None]] = {}
+    kanji_readings: Set[str] = set()
+
+    for sentence in _split_sentences(text):
+        readings: List[str] = []
+        original_surfaces: List[str] = []
+        pos_majors: List[str] = []
+
+        for node in tagger(sentence):
+            feature = node.feature
+            if feature.pos1 == "記号":
+                continue
+            if feature.pos1 == _PUNCTUATION_POS:
+                # UniDic gives punctuation no reading, but it belongs in the phrase.
+                readings.append(node.surface)
+                original_surfaces.append(node.surface)
+                continue
+
+            reading = _hiragana_reading(feature.kana or "")
+            if not reading:
+                continue
+
+            canonical = feature.orthBase or node.surface
+            if _contains_kanji(canonical):
+                surface = canonical
+            else:
+                surface = node.surface
+
+            _register_surface(by_reading, kanji_readings, reading, surface)
+
+            readings.append(reading)
+            original_surfaces.append(node.surface)
+            pos_majors.append(feature.pos1)
+
+        _register_phrase(by_reading, kanji_readings, readings, original_surfaces, pos_majors)
+
+    return by_reading
+
+
+def tokenize_and_deduplicate(texts: Iterable[str]) -> List[Tuple[str, str]]:
+    """Tokenize text with fugashi, deduplicate by reading, and keep canonical forms.
+
+    Mirrors :func:`jptext_extract.tokenizer.tokenize_and_deduplicate`, with
+    UniDic's readings and base spellings (``orthBase``) standing in for
+    Sudachi's readings and dictionary forms. Segmentation follows UniDic, so
+    the entries can differ from the Sudachi backend's.
+    """
+
+    return _deduplicate_pages(_tokenize_page, texts)
+
+
+__all__ = ["tokenize_and_deduplicate"]
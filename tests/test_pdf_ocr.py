@@ -0,0 +1,46 @@
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from jptext_extract import pdf_processing
+
+
+def test_ocr_rasterizes_each_run_of_empty_pages_once(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "scan.pdf"
+    pdf_path.write_bytes(b"")
+
+    raw_pages = ["", "", "本文", "", "abc"]
+    rasterized = []
+
+    def fake_pages(_path):
+        return len(raw_pages), iter(raw_pages)
+
+    def fake_convert_from_path(_path, first_page, last_page):
+        rasterized.append((first_page, last_page))
+        return [f"画像{number}" for number in range(first_page, last_page + 1)]
+
+    fake_tesseract = types.SimpleNamespace(image_to_string=lambda image, lang: image)
+
+    monkeypatch.setattr(pdf_processing, "pymupdf", None)
+    monkeypatch.setattr(pdf_processing, "_pdfminer_pages", fake_pages)
+    monkeypatch.setattr(pdf_processing, "convert_from_path", fake_convert_from_path)
+    monkeypatch.setattr(pdf_processing, "pytesseract", fake_tesseract)
+
+    result = list(pdf_processing.extract_text_per_page(pdf_path))
+
+    assert rasterized == [(1, 2), (4, 5)]
+    assert result == ["画像", "画像", "本文", "画像", "画像"]
+
+
+def test_ocr_workers_limit_tesseract_threads(monkeypatch):
+    monkeypatch.setattr(pdf_processing.os, "cpu_count", lambda: 8)
+    monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+
+    assert pdf_processing._ocr_workers() == 8
+    assert pdf_processing.os.environ["OMP_THREAD_LIMIT"] == "1"
+
+    monkeypatch.setenv("OMP_THREAD_LIMIT", "4")
+
+    assert pdf_processing._ocr_workers() == 2
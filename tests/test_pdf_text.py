@@ -0,0 +1,92 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from jptext_extract import pdf_processing
+
+
+def test_pymupdf_backend_extracts_each_page(monkeypatch, tmp_path):
+    pytest.importorskip("pymupdf")
+    if pdf_processing.pymupdf is None:
+        pytest.skip("installed PyMuPDF does not provide the pymupdf module")
+
+    pymupdf = pdf_processing.pymupdf
+    document = pymupdf.open()
+    document.new_page().insert_text((50, 72), "一頁目です。abc", fontname="japan")
+    document.new_page().insert_text((50, 72), "ｶﾀｶﾅの二頁目", fontname="japan")
+    pdf_path = tmp_path / "pages.pdf"
+    document.save(str(pdf_path))
+
+    def fail_pdfminer(_path):
+        raise AssertionError("pdfminer backend should not be used when PyMuPDF is available")
+
+    monkeypatch.setattr(pdf_processing, "_pdfminer_pages", fail_pdfminer)
+    progress = []
+
+    result = list(
+        pdf_processing.extract_text_per_page(
+            pdf_path, progress_callback=lambda current, total: progress.append((current, total))
+        )
+    )
+
+    assert result == ["一頁目です。", "カタカナの二頁目"]
+    assert progress == [(1, 2), (2, 2)]
+
+
+def test_pdfminer_backend_skips_text_inside_form_xobjects(monkeypatch, tmp_path):
+    # PyMuPDF is only used to build the fixture; extraction runs on pdfminer.
+    pymupdf = pytest.importorskip("pymupdf")
+
+    figure_source = pymupdf.open()
+    figure_source.new_page().insert_text((50, 72), "図の中の文章です。", fontname="japan")
+
+    document = pymupdf.open()
+    page = document.new_page()
+    page.insert_text((50, 72), "本文です", fontname="japan")
+    # show_pdf_page embeds the source page as a Form XObject (an LTFigure).
+    page.show_pdf_page(pymupdf.Rect(50, 200, 300, 400), figure_source, 0)
+    pdf_path = tmp_path / "figure.pdf"
+    document.save(str(pdf_path))
+
+    monkeypatch.setattr(pdf_processing, "pymupdf", None)
+
+    assert list(pdf_processing.extract_text_per_page(pdf_path)) == ["本文です"]
+
+
+def _blank_pdf(tmp_path, page_count):
+    pymupdf = pytest.importorskip("pymupdf")
+    document = pymupdf.open()
+    for _ in range(page_count):
+        document.new_page()
+    pdf_path = tmp_path / "blank.pdf"
+    document.save(str(pdf_path))
+    return pdf_path
+
+
+def test_count_pages_reads_catalog_count(monkeypatch, tmp_path):
+    pdf_path = _blank_pdf(tmp_path, 3)
+
+    def fail_create_pages(_document):
+        raise AssertionError("page tree should not be walked when the catalog has a count")
+
+    monkeypatch.setattr(pdf_processing.PDFPage, "create_pages", fail_create_pages)
+
+    assert pdf_processing._count_pages(pdf_path) == 3
+
+
+def test_count_pages_walks_page_tree_without_catalog_count(monkeypatch, tmp_path):
+    pdf_path = _blank_pdf(tmp_path, 3)
+    resolve1 = pdf_processing.resolve1
+
+    def resolve_without_count(obj):
+        resolved = resolve1(obj)
+        if isinstance(resolved, dict):
+            return {key: value for key, value in resolved.items() if key != "Count"}
+        return resolved
+
+    monkeypatch.setattr(pdf_processing, "resolve1", resolve_without_count)
+
+    assert pdf_processing._count_pages(pdf_path) == 3
@@ -5,7 +5,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from jptext_extract import cli as cli_module
-from jptext_extract.pdf_processing import extract_text_from_txt
+from jptext_extract import pdf_processing
+from jptext_extract.pdf_processing import extract_text_from_txt, filter_non_japanese
 
 
 def test_extract_text_from_txt_filters_ascii(tmp_path):
@@ -17,6 +18,29 @@ def test_extract_text_from_txt_filters_ascii(tmp_path):
     assert result == "カタカナ かな"
 
 
+def test_extract_text_from_txt_reads_in_line_aligned_chunks(monkeypatch, tmp_path):
+    txt_path = tmp_path / "long.txt"
+    txt_path.write_text("一行目です\nabc\n二行目です\n三行目", encoding="utf-8")
+    monkeypatch.setattr(pdf_processing, "_TXT_CHUNK_BYTES", 4)
+
+    result = list(extract_text_from_txt(txt_path))
+
+    assert result == ["一行目です", "二行目です", "三行目"]
+
+
+def test_extract_text_from_txt_empty_file(tmp_path):
+    txt_path = tmp_path / "empty.txt"
+    txt_path.write_bytes(b"")
+
+    assert list(extract_text_from_txt(txt_path)) == []
+
+
+def test_filter_non_japanese_drops_embedded_latin_and_collapses_spaces():
+    text = "漢字abcかな\n\t ｶﾀｶﾅ  ＡＢＣ。"
+
+    assert filter_non_japanese(text) == "漢字かな カタカナ 。"
+
+
 def _iter_inputs(*responses):
     values = iter(responses)
 
@@ -72,3 +96,31 @@ def test_cli_accepts_txt_file(monkeypatch, tmp_path):
         rows = list(csv.reader(handle))
 
     assert rows == [["語"]]
+
+
+def test_entry_point_passes_backend_to_main(monkeypatch):
+    called = {}
+    monkeypatch.setattr(sys, "argv", ["jptext-extract", "--backend", "fugashi"])
+    monkeypatch.setattr(cli_module, "main", lambda backend: called.setdefault("backend", backend))
+
+    cli_module.entry_point()
+
+    assert called["backend"] == "fugashi"
+
+
+def test_load_tokenizer_defaults_to_sudachi():
+    assert cli_module._load_tokenizer("sudachi") is cli_module.tokenize_and_deduplicate
+
+
+def test_cli_reports_unavailable_backend(monkeypatch, capsys):
+    # A None entry in sys.modules makes the import raise ImportError.
+    monkeypatch.setitem(sys.modules, "jptext_extract.tokenizer_fugashi", None)
+
+    def fail_input(_prompt):
+        raise AssertionError("CLI should exit before prompting")
+
+    monkeypatch.setattr("builtins.input", fail_input)
+
+    cli_module.main(backend="fugashi")
+
+    assert "Tokenizer backend 'fugashi' is unavailable" in capsys.readouterr().out
@@ -34,6 +34,8 @@ def stub_tokenizer():
     noun = ("名詞", "普通名詞", "一般", "*", "*", "*")
     particle = ("助詞", "係助詞", "*", "*", "*", "*")
     verb = ("動詞", "普通", "*", "*", "*", "*")
+    comma = ("補助記号", "読点", "*", "*", "*", "*")
+    period = ("補助記号", "句点", "*", "*", "*", "*")
 
     token_sequences = {
         "sample1": [
@@ -53,6 +55,32 @@ def stub_tokenizer():
             StubMorpheme("が", "ガ", "が", particle),
             StubMorpheme("います", "イマス", "居る", verb),
         ],
+        "猫。": [
+            StubMorpheme("猫", "ネコ", "猫", noun),
+            StubMorpheme("。", "。", "。", period),
+        ],
+        "猫がいます。": [
+            StubMorpheme("猫", "ネコ", "猫", noun),
+            StubMorpheme("が", "ガ", "が", particle),
+            StubMorpheme("います", "イマス", "居る", verb),
+            StubMorpheme("。", "。", "。", period),
+        ],
+        "そして、猫がいます。": [
+            StubMorpheme("そして", "ソシテ", "そして", ("接続詞", "*", "*", "*", "*", "*")),
+            StubMorpheme("、", "、", "、", comma),
+            StubMorpheme("猫", "ネコ", "猫", noun),
+            StubMorpheme("が", "ガ", "が", particle),
+            StubMorpheme("います", "イマス", "居る", verb),
+            StubMorpheme("。", "。", "。", period),
+        ],
+        "sample_sentence1。": [
+            StubMorpheme("猫", "ネコ", "猫", noun),
+            StubMorpheme("だ", "ダ", "だ", verb),
+        ],
+        "sample_sentence2": [
+            StubMorpheme("犬", "イヌ", "犬", noun),
+            StubMorpheme("だ", "ダ", "だ", verb),
+        ],
     }
 
     def tokenize(text, _mode):
@@ -79,3 +107,49 @@ def test_tokenize_and_deduplicate_prefers_kanji_and_keeps_phrases(monkeypatch, s
         ("はし", "橋"),
         ("はし", "端"),
     ]
+
+
+def test_tokenize_and_deduplicate_detects_phrases_per_sentence(monkeypatch, stub_tokenizer):
+    monkeypatch.setattr(tokenizer_module, "_get_tokenizer", lambda: stub_tokenizer)
+
+    result = tokenizer_module.tokenize_and_deduplicate(["sample_sentence1。sample_sentence2"])
+
+    assert result == [
+        ("いぬ", "犬"),
+        ("いぬだ", "犬だ"),
+        ("だ", "だ"),
+        ("ねこ", "猫"),
+        ("ねこだ", "猫だ"),
+    ]
+
+
+def test_tokenize_and_deduplicate_ignores_punctuation_in_phrases(monkeypatch, stub_tokenizer):
+    monkeypatch.setattr(tokenizer_module, "_get_tokenizer", lambda: stub_tokenizer)
+
+    result = tokenizer_module.tokenize_and_deduplicate(["猫。猫がいます。"])
+
+    assert result == [
+        ("。", "。"),
+        ("います", "居る"),
+        ("が", "が"),
+        ("ねこ", "猫"),
+        ("ねこがいます", "猫がいます"),
+    ]
+
+
+def test_tokenize_and_deduplicate_keeps_interior_punctuation_in_phrases(
+    monkeypatch, stub_tokenizer
+):
+    monkeypatch.setattr(tokenizer_module, "_get_tokenizer", lambda: stub_tokenizer)
+
+    result = tokenizer_module.tokenize_and_deduplicate(["そして、猫がいます。"])
+
+    assert ("そして、ねこがいます", "そして、猫がいます") in result
+
+
+def test_split_sentences_cuts_long_runs_at_spaces(monkeypatch):
+    monkeypatch.setattr(tokenizer_module, "_MAX_SENTENCE_CHARS", 6)
+
+    result = tokenizer_module._split_sentences("猫です。一二三 四五六七 八九十一二三四五。")
+
+    assert result == ["猫です。", "一二三", "四五六七", "八九十一二三", "四五。"]
@@ -0,0 +1,42 @@
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("fugashi")
+
+from jptext_extract import tokenizer_fugashi
+
+
+def _node(surface, pos1, kana, orth_base):
+    return types.SimpleNamespace(
+        surface=surface,
+        feature=types.SimpleNamespace(pos1=pos1, kana=kana, orthBase=orth_base),
+    )
+
+
+def test_fugashi_backend_uses_unidic_readings_and_base_forms(monkeypatch):
+    nodes = {
+        "sample": [
+            _node("タワー", "名詞", "タワー", "タワー"),
+            _node("に", "助詞", "ニ", "に"),
+            _node("い", "動詞", "イ", "居る"),
+            _node("する", "動詞", "スル", "する"),
+            _node("。", "補助記号", "", "。"),
+            _node("xyzzy", "名詞", None, None),
+        ],
+    }
+    monkeypatch.setattr(tokenizer_fugashi, "_get_tagger", lambda: nodes.get)
+
+    result = tokenizer_fugashi.tokenize_and_deduplicate(["sample"])
+
+    assert result == [
+        ("い", "居る"),
+        ("する", "する"),
+        ("たわー", "タワー"),
+        ("たわーにいする", "タワーにいする"),
+        ("に", "に"),
+    ]